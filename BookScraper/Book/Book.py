@@ -1,6 +1,15 @@
-import re
+from lxml.etree import XPath
 
-DICT_FOR_CONVERT = {
+STOCK_TEXT = "string(//p[@class='instock availability'])"
+
+TITLE = XPath("string(//h1)", smart_strings=False)
+DESCRIPTION = XPath("string(//div[@id='product_description']/following-sibling::p[1])", smart_strings=False)
+PRICE = XPath("string(//p[@class='price_color'])", smart_strings=False)
+RATING = XPath("string(//p[contains(@class,'star-rating')]/@class)", smart_strings=False)
+STOCK = XPath("translate(%s, translate(%s, '0123456789', ''), '')" % (STOCK_TEXT, STOCK_TEXT), smart_strings=False)
+CATEGORY = XPath("string(//ul[@class='breadcrumb']/li[3]/a)", smart_strings=False)
+
+RATING_MAP = {
     'One': 1,
     'Two': 2,
     'Three': 3,
@@ -10,68 +19,48 @@ DICT_FOR_CONVERT = {
 }
 
 
-def convert_string_to_number(rating):
-    return DICT_FOR_CONVERT[rating]
-
-
 class Book(object):
-    def __init__(self, soup):
-        self.title = self.set_title(soup)
-        self.description = self.set_description(soup)
-        self.price = self.set_price(soup)
-        self.star_rating = self.set_star_rating(soup)
-        self.in_stock = self.set_in_stock(soup)
-        self.category = self.set_category(soup)
+    __slots__ = ('title', 'description', 'price', 'star_rating', 'in_stock', 'category',
+                 '_title_ascii', '_category_ascii', '_description_ascii')
+
+    def __init__(self, tree):
+        self.title = self.set_title(tree)
+        self.description = self.set_description(tree)
+        self.price = self.set_price(tree)
+        self.star_rating = self.set_star_rating(tree)
+        self.in_stock = self.set_in_stock(tree)
+        self.category = self.set_category(tree)
+        self._title_ascii = self.title.encode('ascii', 'ignore').decode('ascii')
+        self._category_ascii = self.category.encode('ascii', 'ignore').decode('ascii')
+        self._description_ascii = self.description.encode('ascii', 'ignore').decode('ascii')
 
     @staticmethod
-    def set_title(soup):
-        try:
-            return soup.find('h1').text
-        except AttributeError:
-            return "N/A"
+    def set_title(tree):
+        return TITLE(tree) or "N/A"
 
     @staticmethod
-    def set_description(soup):
-        try:
-            return soup.find('p', class_="").text
-        except AttributeError:
-            return "N/A"
+    def set_description(tree):
+        return DESCRIPTION(tree) or "N/A"
 
     @staticmethod
-    def set_price(soup):
-        try:
-            price_string = soup.find('p', class_='price_color').text
-            price = float(price_string[2:])
-            return price
-        except AttributeError:
-            return 'N/A'
+    def set_price(tree):
+        price_string = PRICE(tree)
+        return float(price_string[2:]) if price_string else 'N/A'
 
     @staticmethod
-    def set_star_rating(soup):
-        try:
-            return convert_string_to_number(soup.find('p', class_='star-rating')['class'][1])
-        except AttributeError:
-            return 'N/A'
+    def set_star_rating(tree):
+        classes = RATING(tree).split()
+        return RATING_MAP[classes[1]] if len(classes) > 1 else 'N/A'
 
     @staticmethod
-    def set_in_stock(soup):
-        try:
-            num = ""
-            for index in soup.find('p', class_='instock availability').text:
-                if index.isdigit():
-                    num = num + index
-            return int(num)
-        except AttributeError:
-            return 'N/A'
+    def set_in_stock(tree):
+        stock = STOCK(tree)
+        return int(stock) if stock else 'N/A'
 
     @staticmethod
-    def set_category(soup):
-        try:
-            return soup.find('a', href=re.compile("../category/books//*")).text
-        except AttributeError:
-            return "N/A"
+    def set_category(tree):
+        return CATEGORY(tree) or "N/A"
 
     def __str__(self):
         return "Title : %s\nStar rating :  %d\nPrice :  %.2f\nIn_stock : %d\nCategory : %s\nDescription : %s\n" % (
-            self.title.encode('ascii', 'ignore'), self.star_rating, self.price, self.in_stock, self.category.encode('ascii', 'ignore'),
-            self.description.encode('ascii', 'ignore'))
+            self._title_ascii, self.star_rating, self.price, self.in_stock, self._category_ascii, self._description_ascii)
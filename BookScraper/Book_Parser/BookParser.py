@@ -1,5 +1,4 @@
 import argparse
-from JsonReader.AddToJSON import AddToJson
 from GUI_Tkinter.GUI_Tkinter import GUI_Tkinter
 
 
@@ -10,7 +9,6 @@ class BookParser(object):
 
     def __add_arguments_functionality(self):
         parser = argparse.ArgumentParser()
-        json_reader = AddToJson()
         parser.add_argument('-b', '--book_number', dest='book_number',default=1000, type=int, help='number of books')
         parser.add_argument('-g', '--genres', dest='genres', nargs='+', help='list of genres')
         parser.add_argument('-d', '--description', dest='descr', nargs='+',
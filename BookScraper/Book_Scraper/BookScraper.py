@@ -1,60 +1,80 @@
+from concurrent.futures import ThreadPoolExecutor
 from Book.Book import Book
-from bs4 import BeautifulSoup
-import requests
+from Http_Session.HttpSession import SESSION, TIMEOUT
 from Filters_Categories_Sort.Filters import Filters
 from Link_Builder.LinkBuilder import LinkBuilder
+from Page_Parser.PageParser import make_tree, CATALOGUE_BOOKS, CATALOGUE_BOOK_HREF, NEXT_PAGE_HREF
+
+MAX_WORKERS = 16
 
 
 class BookScraper(object):
-    list_with_books = []
-    links_of_all_books = []
 
     def __init__(self, num_of_books, filters, links_of_categories):
         self.categories_url = links_of_categories
+        self.list_with_books = []
+        self.links_of_all_books = []
         self.request_handler = None
-        self.soup = None
-        self.filters = Filters(filters)
+        self.tree = None
+        self.detail_cache = {}
+        self.filters = Filters(filters, self.detail_cache)
         self.num_of_books = num_of_books
+        self.executor = None
+        self.book_futures = []
 
     def scraping(self):
-        for link in self.categories_url:
-            if self.__get_n_books(link):
-                break
+        self.executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        with self.executor:
+            for link in self.categories_url:
+                if self.__get_n_books(link):
+                    break
 
     def __get_n_books(self, category_link):
         next_page_link = LinkBuilder(category_link)
         while True:
-            self.request_handler = requests.get(next_page_link.category_link)
-            self.soup = BeautifulSoup(self.request_handler.text, 'html.parser')
+            self.request_handler = SESSION.get(next_page_link.category_link, timeout=TIMEOUT)
+            self.tree = make_tree(self.request_handler.text)
             self.num_of_books = self.__get_all_books_links_on_page(self.num_of_books)
             if self.num_of_books:
-                try:
-                    href_next_page = self.soup.find('li', class_='next').find('a', href=True)
-                    next_page_link.build_next_page_link(href_next_page)
-                    print(next_page_link.category_link)
-                except AttributeError:
+                href_next_page = NEXT_PAGE_HREF(self.tree)
+                if not href_next_page:
                     return False
+                next_page_link.build_next_page_link(href_next_page[0])
+                print(next_page_link.category_link)
 
             else:
                 return True
 
     def __get_all_books_links_on_page(self, n):
-        book_data = self.soup.find_all('li', class_='col-xs-6 col-sm-4 col-md-3 col-lg-3')
-        current_number = 0
-        for book_url in book_data:
-            if current_number < n:
-                if self.filters.list_with_filters is None or self.filters.filtering(book_url):
-                    link = book_url.find('a', href=True)
-                    self.links_of_all_books.append(link['href'])
-                    current_number += 1
-            else:
-                return 0
+        if n <= 0:
+            return 0
+        book_data = CATALOGUE_BOOKS(self.tree)
+        if self.filters.list_with_filters is None:
+            selected = book_data[:n]
+        else:
+            selected = []
+            for book_url in book_data:
+                if len(selected) == n:
+                    break
+                if self.filters.filtering(book_url):
+                    selected.append(book_url)
+                else:
+                    self.detail_cache.pop(CATALOGUE_BOOK_HREF(book_url)[0], None)
+
+        for book_url in selected:
+            link = CATALOGUE_BOOK_HREF(book_url)[0]
+            self.links_of_all_books.append(link)
+            self.book_futures.append(self.executor.submit(self.get_data_for_book, link))
+        return n - len(selected)
 
-        return n - current_number
+    def get_data_for_all_books(self):
+        self.list_with_books.extend(future.result() for future in self.book_futures)
 
     def get_data_for_book(self, book):
-        link_builder = LinkBuilder()
-        link_builder.build_book_page_link(book)
-        self.request_handler = requests.get(link_builder.category_link)
-        self.soup = BeautifulSoup(self.request_handler.text, 'html.parser')
-        self.list_with_books.append(Book(self.soup))
+        tree = self.detail_cache.pop(book, None)
+        if tree is None:
+            link_builder = LinkBuilder()
+            link_builder.build_book_page_link(book)
+            request_handler = SESSION.get(link_builder.category_link, timeout=TIMEOUT)
+            tree = make_tree(request_handler.text)
+        return Book(tree)
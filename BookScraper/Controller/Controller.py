@@ -4,41 +4,44 @@ from Filters_Categories_Sort.Sort import Sort
 from Filters_Categories_Sort.Categories import Categories
 from JsonReader.AddToJSON import AddToJson
 from GUI_Tkinter.GUI_Tkinter import GUI_Tkinter
+from Http_Session.HttpSession import SESSION
 
 
 def controller():
-    book_parser = BookParser()
+    try:
+        book_parser = BookParser()
 
-    if book_parser.parser.X:
-        GUI_Tkinter()
-        return
+        if book_parser.parser.X:
+            GUI_Tkinter()
+            return
 
-    json_reader = AddToJson()
-    sort = Sort(book_parser.parser.sorting)
-    categories = Categories(book_parser.parser.genres)
+        sort = Sort(book_parser.parser.sorting)
+        categories = Categories(book_parser.parser.genres)
 
-    categories.list_of_all_category()
+        categories.list_of_all_category()
 
-    book_scraper = BookScraper(book_parser.parser.book_number, book_parser.parser.filtering, categories.links)
-    book_scraper.scraping()
+        book_scraper = BookScraper(book_parser.parser.book_number, book_parser.parser.filtering, categories.links)
+        book_scraper.scraping()
+        json_reader = AddToJson(book_scraper)
 
-    append_to_the_list_with_books(book_scraper)
-    sort.sorting(book_scraper.list_with_books)
-    print_different_types_of_sorts(sort)
+        append_to_the_list_with_books(book_scraper)
+        sort.sorting(book_scraper.list_with_books)
+        print_different_types_of_sorts(sort)
 
-    if book_parser.parser.title_list is None:
-        json_reader.info_to_json()
-    else:
-        print json_reader.load_list_with_titles_from_json()
+        if book_parser.parser.title_list is None:
+            json_reader.info_to_json()
+        else:
+            print json_reader.load_list_with_titles_from_json()
 
-    print(len(book_scraper.list_with_books))
+        print(len(book_scraper.list_with_books))
 
-    print book_parser.parser
+        print book_parser.parser
+    finally:
+        SESSION.close()
 
 
 def append_to_the_list_with_books(book_scraper):
-    for book in book_scraper.links_of_all_books:
-        book_scraper.get_data_for_book(book)
+    book_scraper.get_data_for_all_books()
 
 
 def print_different_types_of_sorts(sort):
@@ -1,5 +1,5 @@
-import requests
-from bs4 import BeautifulSoup
+from Http_Session.HttpSession import SESSION, TIMEOUT
+from Page_Parser.PageParser import make_soup, LINKS
 
 NONE_GROUP_LINK = 'http://books.toscrape.com/catalogue/category/books_1/index.html'
 BASE_URL = "http://books.toscrape.com/"
@@ -15,15 +15,16 @@ class Categories(object):
         if self.category_list is None:
             self.links.append(NONE_GROUP_LINK)
         else:
+            group_links = self.get_group_links()
             for group in self.category_list:
-                self.links.append(self.set_group_link(group))
+                self.links.append(group_links.get(group))
 
     @staticmethod
-    def set_group_link(category):
-        request_handler = requests.get(BASE_URL)
-        soup = BeautifulSoup(request_handler.text, 'html.parser')
-        categories = soup.find_all('a', href=True)
+    def get_group_links():
+        request_handler = SESSION.get(BASE_URL, timeout=TIMEOUT)
+        soup = make_soup(request_handler.text, LINKS)
+        group_links = {}
 
-        for item in categories:
-            if item.text.strip() == category:
-                return BASE_URL + item['href']
+        for item in soup.find_all('a', href=True):
+            group_links.setdefault(item.text.strip(), BASE_URL + item['href'])
+        return group_links
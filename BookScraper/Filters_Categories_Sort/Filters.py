@@ -1,71 +1,46 @@
-import requests
-from bs4 import BeautifulSoup
+from operator import lt, gt, eq
+from Http_Session.HttpSession import SESSION, TIMEOUT
 from Link_Builder.LinkBuilder import LinkBuilder
-from Book.Book import Book, convert_string_to_number
+from Book.Book import Book, RATING_MAP
+from Page_Parser.PageParser import make_tree, CATALOGUE_BOOK_HREF, CATALOGUE_BOOK_PRICE, CATALOGUE_BOOK_RATING
+
+EXPENSIVE_FILTERS = ('in_stock',)
+COMPARATORS = {'<': lt, '>': gt, '=': eq}
 
 
 class Filters(object):
 
-    def __init__(self, list_with_filters):
+    def __init__(self, list_with_filters, detail_cache):
         self.list_with_filters = list_with_filters
+        self.detail_cache = detail_cache
+        self.cheap = [self.compile(item) for item in list_with_filters or [] if item[0] not in EXPENSIVE_FILTERS]
+        self.expensive = [self.compile(item) for item in list_with_filters or [] if item[0] in EXPENSIVE_FILTERS]
 
     def filtering(self, current_book):
-        for current_filter in self.list_with_filters:
-            if not self.__select_filter(current_book, current_filter):
-                return False
-        return True
+        return all(compare(get(current_book), number) for get, compare, number in self.cheap) and \
+            all(compare(get(current_book), number) for get, compare, number in self.expensive)
 
-    def __select_filter(self, current_book, item):
-        if item[1] == '<':
-            return self.lower_than(self.get_value(current_book, item[0]), int(item[2]))
-        elif item[1] == '>':
-            return self.bigger_than(self.get_value(current_book, item[0]), int(item[2]))
-        else:
-            return self.equal(self.get_value(current_book, item[0]), int(item[2]))
+    def compile(self, item):
+        return self.get_getter(item[0]), COMPARATORS.get(item[1], eq), int(item[2])
 
-    @staticmethod
-    def lower_than(filter, number):
-        if filter < number:
-            return True
-        return False
-
-    @staticmethod
-    def bigger_than(filter, number):
-        if filter > number:
-            return True
-        return False
-
-    @staticmethod
-    def equal(filter, number):
-        if filter == number:
-            return True
-        return False
-
-    def get_value(self, current_book, filter_by):
-        if filter_by == 'price':
-            return self.get_price(current_book)
-        elif filter_by == 'rating':
-            return self.get_rating(current_book)
-        elif filter_by == 'in_stock':
-            return self.get_in_stock(current_book)
+    def get_getter(self, filter_by):
+        getters = {'price': self.get_price, 'rating': self.get_rating, 'in_stock': self.get_in_stock}
+        return getters.get(filter_by, lambda current_book: None)
 
     @staticmethod
     def get_price(current_book):
-        price_string = current_book.find('p', class_='price_color').text
-        price = float(price_string[2:])
+        price = float(CATALOGUE_BOOK_PRICE(current_book)[2:])
         return price
 
     @staticmethod
     def get_rating(current_book):
-        rating = current_book.find('p', class_='star-rating')['class'][1]
-        return convert_string_to_number(rating)
-
-    @staticmethod
-    def get_in_stock(current_book):
-        link_builder = LinkBuilder()
-        link = current_book.find('a', href=True)
-        link_builder.build_book_page_link(link['href'])
-        request_handler = requests.get(link_builder.category_link)
-        soup = BeautifulSoup(request_handler.text, 'html.parser')
-        book = Book(soup)
-        return book.in_stock
+        return RATING_MAP[CATALOGUE_BOOK_RATING(current_book).split()[1]]
+
+    def get_in_stock(self, current_book):
+        href = CATALOGUE_BOOK_HREF(current_book)[0]
+        if href not in self.detail_cache:
+            link_builder = LinkBuilder()
+            link_builder.build_book_page_link(href)
+            request_handler = SESSION.get(link_builder.category_link, timeout=TIMEOUT)
+            self.detail_cache[href] = make_tree(request_handler.text)
+        return Book.set_in_stock(self.detail_cache[href])
@@ -1,3 +1,6 @@
+from operator import attrgetter
+
+
 class Sort(object):
     dict_with_sorted_books_lists = {}
 
@@ -14,7 +17,4 @@ class Sort(object):
 
     @staticmethod
     def sort(list_of_books, sort_by='title', option='ascending'):
-        if option == 'ascending':
-            return sorted(list_of_books, key=lambda x: getattr(x, sort_by))
-        else:
-            return sorted(list_of_books, key=lambda x: getattr(x, sort_by), reverse=True)
+        return sorted(list_of_books, key=attrgetter(sort_by), reverse=option != 'ascending')
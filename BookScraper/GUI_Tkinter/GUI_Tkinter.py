@@ -47,10 +47,7 @@ class GUI_Tkinter:
 
         start_scr = BookScraper(int(self.entry1.get()), None, categories.links)
         start_scr.scraping()
-
-
-        for book in start_scr.links_of_all_books:
-            start_scr.get_data_for_book(book)
+        start_scr.get_data_for_all_books()
 
         sort.sorting(start_scr.list_with_books)
 
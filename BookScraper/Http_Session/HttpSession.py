@@ -0,0 +1,10 @@
+import requests
+from requests.adapters import HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
+
+TIMEOUT = 10
+
+SESSION = requests.Session()
+ADAPTER = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=Retry(total=3, backoff_factor=0.2))
+SESSION.mount('http://', ADAPTER)
+SESSION.mount('https://', ADAPTER)
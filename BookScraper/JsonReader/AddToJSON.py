@@ -1,6 +1,6 @@
 import json
+from Book.Book import Book
 import requests
-from Book_Scraper.BookScraper import BookScraper
 from bs4 import BeautifulSoup
 
 BASE_URL = "http://books.toscrape.com/index.html"
@@ -8,26 +8,24 @@ BASE_URL = "http://books.toscrape.com/index.html"
 
 class AddToJson(object):
 
-    def __init__(self):
-        self.book_data = BookScraper.list_with_books
+    def __init__(self, scraper):
+        self.book_data = scraper.list_with_books
         self.filename = 'BooksInJSON.json'
         # self.soup = BeautifulSoup(request_handler.text, 'html.parser')
 
     def info_to_json(self):
-        books = {}
         with open(self.filename, 'w') as file_object:
+            file_object.write('{')
+            separator = '\n'
             for book in self.book_data:
-                books[book.title] = book.__dict__
-            json.dump(books, file_object, indent=4)
+                fields = {field: getattr(book, field) for field in Book.__slots__ if not field.startswith('_')}
+                file_object.write('%s%s: %s' % (separator, json.dumps(book.title), json.dumps(fields, indent=4)))
+                separator = ',\n'
+            file_object.write('\n}\n')
 
     def load_list_with_titles_from_json(self):
-        titles = []
-        json_file = open(self.filename)
-        data = json.load(json_file)
-        for book_title in data:
-            titles.append(book_title)
-        json_file.close()
-        return titles
+        with open(self.filename) as json_file:
+            return list(json.load(json_file))
 
     # def get_titles_from_website(self):
     #     request_handler = requests.get(BASE_URL)
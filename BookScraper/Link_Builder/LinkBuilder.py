@@ -1,8 +1,12 @@
-import re
+import logging
 
 BASE_URL = "http://books.toscrape.com/catalogue/"
-INDEX = "index.html"
 LINK_FORMAT = "../../../"
+SHORT_LINK_FORMAT = "../../"
+LINK_FORMAT_LENGTH = len(LINK_FORMAT)
+SHORT_LINK_FORMAT_LENGTH = len(SHORT_LINK_FORMAT)
+
+LOG = logging.getLogger(__name__)
 
 
 class LinkBuilder(object):
@@ -10,16 +14,12 @@ class LinkBuilder(object):
     def __init__(self, category_link=BASE_URL):
         self.category_link = category_link
 
-    def build_next_page_link(self, link):
-        if INDEX in self.category_link:
-            self.category_link = self.category_link.replace(INDEX, link['href'])
-        else:
-            self.category_link = re.sub('page-.+html', link['href'], self.category_link)
+    def build_next_page_link(self, href):
+        self.category_link = self.category_link[:self.category_link.rfind('/') + 1] + href
 
     def build_book_page_link(self, link):
-        if LINK_FORMAT in link:
-            print(self.category_link + link[9:])
-            self.category_link = self.category_link + link[9:]
+        if link.startswith(LINK_FORMAT):
+            self.category_link += link[LINK_FORMAT_LENGTH:]
         else:
-            print(self.category_link + link[6:])
-            self.category_link = self.category_link + link[6:]
+            self.category_link += link[SHORT_LINK_FORMAT_LENGTH:]
+        LOG.debug('%s', self.category_link)
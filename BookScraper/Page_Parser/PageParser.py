@@ -0,0 +1,21 @@
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml.etree import XPath
+
+PARSER = 'lxml'
+
+LINKS = SoupStrainer('a', href=True)
+
+CATALOGUE_BOOKS = XPath("//li[contains(@class,'col-md-3')]/article")
+CATALOGUE_BOOK_HREF = XPath("./h3/a/@href", smart_strings=False)
+CATALOGUE_BOOK_PRICE = XPath("string(.//p[@class='price_color'])", smart_strings=False)
+CATALOGUE_BOOK_RATING = XPath("string(.//p[contains(@class,'star-rating')]/@class)", smart_strings=False)
+NEXT_PAGE_HREF = XPath("//li[@class='next']/a/@href", smart_strings=False)
+
+
+def make_soup(text, parse_only=None):
+    return BeautifulSoup(text, PARSER, parse_only=parse_only)
+
+
+def make_tree(text):
+    return lxml.html.fromstring(text)